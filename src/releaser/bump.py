@@ -1,9 +1,9 @@
 """Module for checking for a version bump."""
 
 import logging
-import uuid
+import pathlib
 
-from commitizen.exceptions import NoneIncrementExit
+from commitizen.exceptions import NoCommitsFoundError, NoneIncrementExit
 
 from .core import commits
 from .core.repository import GitRepository
@@ -16,20 +16,31 @@ def bump(
     repo: GitRepository, source: str, changelog_template: str | None
 ) -> tuple[Version | None, str | None]:
     """Check if repository version can be bumped."""
-    temp_branch = str(uuid.uuid4())
+    release_branches = repo.find_release_branches()
+    logger.info("Release branches found: %s", release_branches)
+    if not release_branches:
+        return bump_workdir(repo, repo.get_workdir(), changelog_template)
+
+    merge_commit = repo.create_merge_commit(source, release_branches[0])
+    release_head = repo.find_reference(release_branches[0])
+    if release_head and merge_commit == release_head.commit:
+        logger.info(
+            "Skipping merge, '%s' is already merged into '%s'.",
+            source,
+            release_branches[0],
+        )
+    else:
+        logger.info("Merged '%s' into '%s'", source, release_branches[0])
+    with repo.temporary_worktree(merge_commit) as workdir:
+        logger.info("Check out merge commit '%s' in '%s'", merge_commit, workdir)
+        return bump_workdir(repo, workdir, changelog_template)
+
+
+def bump_workdir(
+    repo: GitRepository, workdir: pathlib.Path, changelog_template: str | None
+) -> tuple[Version | None, str | None]:
+    """Check if the version checked out in a working directory can be bumped."""
     try:
-        release_branches = repo.find_release_branches()
-        logger.info("Release branches found: %s", release_branches)
-        if release_branches:
-            logger.info(
-                "Check out temporary branch '%s' on '%s'",
-                temp_branch,
-                release_branches[0],
-            )
-            repo.checkout(temp_branch, release_branches[0])
-            logger.info("Merging '%s' into '%s'", source, temp_branch)
-            repo.merge(source, temp_branch)
-        workdir = repo.get_workdir()
         logger.info("Reading changelog from '%s'.", workdir)
         url = repo.get_url()
         logger.info("Linking to '%s'.", url)
@@ -40,7 +51,7 @@ def bump(
             next_version,
             changelog_template,
         )
-    except NoneIncrementExit:
+    except (NoCommitsFoundError, NoneIncrementExit):
         logger.info("Could not find commits triggering new version.")
         return None, None
     except Exception:
@@ -49,6 +60,3 @@ def bump(
         logger.info("Next version: %s", next_version.version.base_version)
         logger.info(changelog)
         return next_version, changelog
-    finally:
-        logger.info("Delete temporary branch '%s'", temp_branch)
-        repo.delete(temp_branch)
@@ -1,9 +1,11 @@
 """Module for interacting with the release package from the CLI."""
 
 import argparse
+import functools
 import os
 import pathlib
-import uuid
+import tempfile
+from collections.abc import Iterator
 
 from . import bump, check, release
 from .changelog_templates import templates
@@ -14,8 +16,21 @@ GITHUB_OUTPUT = "GITHUB_OUTPUT"
 RUNNER_TEMP = "RUNNER_TEMP"
 
 
-def parse(args: list[str]) -> argparse.Namespace:
-    """Parse command line arguments."""
+class TemplateChoices:
+    """Changelog template names, only looked up when a template is given."""
+
+    def __contains__(self, template: object) -> bool:
+        """Check if a changelog template exists."""
+        return template in templates.get_all_templates()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the changelog template names."""
+        return iter(templates.get_all_templates())
+
+
+@functools.cache
+def _parser() -> argparse.ArgumentParser:
+    """Build the command line parser once."""
     parser = argparse.ArgumentParser(
         prog="python -m releaser",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -45,9 +60,10 @@ def parse(args: list[str]) -> argparse.Namespace:
         "-t",
         "--changelog-template",
         type=str,
-        choices=templates.get_all_templates(),
-        help="Specify the changelog template to use. If not specified, default "
-        "template will be used.",
+        choices=TemplateChoices(),
+        metavar="TEMPLATE",
+        help="Specify the changelog template to use, one of %(choices)s. If not "
+        "specified, default template will be used.",
     )
 
     check = action.add_parser("check", help="Check commit message format.")
@@ -65,7 +81,12 @@ def parse(args: list[str]) -> argparse.Namespace:
         help="Directory of the release repository.",
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+def parse(args: list[str]) -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _parser().parse_args(args)
 
 
 def get_env_variable(variable_name: str) -> str:
@@ -79,31 +100,27 @@ def get_env_variable(variable_name: str) -> str:
 
 def write_changelog(runner_temp: pathlib.Path, changelog: str) -> pathlib.Path:
     """Write version changelog into temporary file."""
-    temp_changelog_file = runner_temp / f"{uuid.uuid4()!s}.md"
-    with temp_changelog_file.open(mode="w") as f:
+    fd, temp_changelog_file = tempfile.mkstemp(suffix=".md", dir=runner_temp)
+    with os.fdopen(fd, mode="w") as f:
         f.write(changelog)
-    return temp_changelog_file
-
-
-def output_release_ready(
-    github_output: pathlib.Path,
-    release_ready: bool,
-) -> None:
-    """Write release ready status into github output."""
-    with github_output.open(mode="a") as f:
-        release_ready_value = "true" if release_ready else "false"
-        f.write(f"ready={release_ready_value}\n")
+    return pathlib.Path(temp_changelog_file)
 
 
 def output_release(
     github_output: pathlib.Path,
-    next_version: Version,
-    temp_changelog_file: pathlib.Path,
+    *,
+    ready: bool,
+    next_version: Version | None = None,
+    temp_changelog_file: pathlib.Path | None = None,
 ) -> None:
-    """Write release info into github output."""
+    """Write release ready status and release info into github output."""
+    outputs = [f"ready={"true" if ready else "false"}"]
+    if next_version:
+        outputs.append(f"tag={next_version.get_release_tag()}")
+    if temp_changelog_file:
+        outputs.append(f"changelog={temp_changelog_file}")
     with github_output.open(mode="a") as f:
-        f.write(f"tag={next_version.get_release_tag()}\n")
-        f.write(f"changelog={temp_changelog_file}\n")
+        f.write("\n".join(outputs) + "\n")
 
 
 def main(args: argparse.Namespace) -> None:
@@ -115,11 +132,16 @@ def main(args: argparse.Namespace) -> None:
         github_output = pathlib.Path(get_env_variable(GITHUB_OUTPUT))
         runner_temp = pathlib.Path(get_env_variable(RUNNER_TEMP))
         next_version, changelog = bump.bump(repo, args.source, args.changelog_template)
-        release_ready = bool(next_version and changelog)
-        output_release_ready(github_output, release_ready)
         if next_version and changelog:
             release.release(
                 repo, args.source, next_version, changelog, dry_run=args.dry_run
             )
             temp_changelog_file = write_changelog(runner_temp, changelog)
-            output_release(github_output, next_version, temp_changelog_file)
+            output_release(
+                github_output,
+                ready=True,
+                next_version=next_version,
+                temp_changelog_file=temp_changelog_file,
+            )
+        else:
+            output_release(github_output, ready=False)
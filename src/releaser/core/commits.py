@@ -1,20 +1,83 @@
 """Module for interacting with commit history."""
 
+import functools
 import io
 import os
 import pathlib
 import re
-import sys
 from collections.abc import Iterator
 from contextlib import contextmanager, redirect_stdout
+from typing import Any, TextIO, cast
 
-from commitizen.cli import main as commitizen
+from commitizen import defaults
+from commitizen.commands import Bump, Changelog, Check
+from commitizen.config import BaseConfig, read_cfg
 from commitizen.exceptions import DryRunExit
+from commitizen.providers import get_provider
+from jinja2 import ChoiceLoader, FileSystemLoader
 
 from releaser.changelog_templates import templates
 
 from .version import Version
 
+_VERSION_PREFIX = "tag to create: v"
+_VERSION_RE = re.compile(rf"{_VERSION_PREFIX}(\d+\.\d+\.\d+)")
+
+BUMP_ARGUMENTS: dict[str, Any] = {
+    "dry_run": True,
+    "files_only": False,
+    "local_version": False,
+    "changelog": False,
+    "no_verify": False,
+    "yes": True,
+    "tag_format": None,
+    "bump_message": None,
+    "prerelease": None,
+    "devrelease": None,
+    "increment": None,
+    "increment_mode": "linear",
+    "check_consistency": False,
+    "annotated_tag": False,
+    "annotated_tag_message": None,
+    "gpg_sign": False,
+    "changelog_to_stdout": False,
+    "git_output_to_stderr": False,
+    "retry": False,
+    "major_version_zero": None,
+    "template": None,
+    "extras": None,
+    "file_name": None,
+    "prerelease_offset": None,
+    "version_scheme": None,
+    "version_type": None,
+    "manual_version": None,
+    "build_metadata": None,
+    "get_next": False,
+}
+
+
+class BumpLog(io.TextIOBase):
+    """Output stream keeping only the bump log line with the tag to create."""
+
+    def __init__(self) -> None:
+        """Initialize an empty bump log."""
+        super().__init__()
+        self.pending_line = ""
+        self.version_line = ""
+
+    def write(self, s: str, /) -> int:
+        """Scan written lines until the tag to create is announced."""
+        if not self.version_line:
+            *lines, self.pending_line = f"{self.pending_line}{s}".split("\n")
+            self.version_line = next(
+                (line for line in lines if _VERSION_PREFIX in line), ""
+            )
+        return len(s)
+
+    def writable(self) -> bool:
+        """Accept writes."""
+        return True
+
 
 @contextmanager
 def set_working_dir(new_dir: pathlib.Path) -> Iterator[None]:
@@ -27,56 +90,44 @@ def set_working_dir(new_dir: pathlib.Path) -> Iterator[None]:
         os.chdir(original_dir)
 
 
-@contextmanager
-def set_system_args(args: list[str]) -> Iterator[None]:
-    """Set system arguments."""
-    original_argv = sys.argv
-    try:
-        sys.argv = args
-        yield
-    finally:
-        sys.argv = original_argv
+def load_config(path: pathlib.Path) -> BaseConfig:
+    """Load the commitizen configuration, reused while its files are unchanged."""
+    config_mtimes = tuple(
+        config_file.stat().st_mtime_ns if config_file.exists() else None
+        for config_file in (path / name for name in defaults.config_files)
+    )
+    return _read_config(path, config_mtimes)
 
 
-@contextmanager
-def set_changelog_template(
-    path: pathlib.Path, url: str, args: list[str], changelog_template: str | None
-) -> Iterator[None]:
-    """Create a symbolic link to the template file and remove it afterwards."""
-    if changelog_template and __package__:
-        commit_url = f"{url.removesuffix(".git")}/commit/"
-        template_file = templates.get_template_file(changelog_template)
-        destination_template_symlink = path / changelog_template
-        relative_template_path = destination_template_symlink.relative_to(path)
-        try:
-            os.symlink(template_file, destination_template_symlink)
-            args.extend(
-                [
-                    "--template",
-                    str(relative_template_path),
-                    "--extra",
-                    f"commit_url={commit_url}",
-                ]
-            )
-            yield
-        finally:
-            destination_template_symlink.unlink()
-    else:
-        yield
+@functools.lru_cache(maxsize=4)
+def _read_config(
+    path: pathlib.Path,
+    config_mtimes: tuple[int | None, ...],  # noqa: ARG001 only part of the cache key
+) -> BaseConfig:
+    """Read the commitizen configuration found in a directory."""
+    with set_working_dir(path):
+        config = read_cfg()
+    if not config.path:
+        config.update({"name": "cz_conventional_commits"})
+    return config
+
+
+def set_changelog_template(changelog: Changelog, changelog_template: str) -> None:
+    """Let the changelog find a bundled template before the commitizen ones."""
+    template_file = pathlib.Path(templates.get_template_file(changelog_template))
+    changelog.cz.template_loader = ChoiceLoader(
+        [FileSystemLoader(template_file.parent), changelog.cz.template_loader]
+    )
 
 
 def bump(path: pathlib.Path) -> Version:
     """Check if repository version can be bumped."""
-    stdout = io.StringIO()
+    bump_log = BumpLog()
     try:
-        with (
-            redirect_stdout(stdout),
-            set_working_dir(path),
-            set_system_args(["cz", "bump", "--yes", "--dry-run"]),
-        ):
-            commitizen()
+        with redirect_stdout(cast(TextIO, bump_log)), set_working_dir(path):
+            Bump(load_config(path), BUMP_ARGUMENTS)()
     except DryRunExit:
-        return extract_version(stdout.getvalue())
+        return extract_version(bump_log.version_line)
     except Exception:
         raise
     else:
@@ -86,8 +137,8 @@ def bump(path: pathlib.Path) -> Version:
 
 def extract_version(log: str) -> Version:
     """Extract semantic version from commitizen message."""
-    pattern = r"tag to create: v(\d+\.\d+\.\d+)"
-    match = re.search(pattern, log)
+    start = log.find(_VERSION_PREFIX)
+    match = _VERSION_RE.match(log, start) if start != -1 else None
     if match:
         return Version(match.group(1))
     msg = "Version could not be found in bump log."
@@ -96,14 +147,8 @@ def extract_version(log: str) -> Version:
 
 def get_current_version(path: pathlib.Path) -> Version:
     """Get current repository version."""
-    stdout = io.StringIO()
-    with (
-        redirect_stdout(stdout),
-        set_working_dir(path),
-        set_system_args(["cz", "version", "--project"]),
-    ):
-        commitizen()
-    base_version = stdout.getvalue()
+    with set_working_dir(path):
+        base_version = get_provider(load_config(path)).get_version()
     if not base_version:
         msg = "No version could be found."
         raise RuntimeError(msg)
@@ -115,25 +160,24 @@ def get_changelog(
 ) -> str:
     """Get changelog from commit history."""
     current_version = get_current_version(path)
-    args = [
-        "cz",
-        "changelog",
-        "--dry-run",
-        "--unreleased-version",
-        next_version.get_release_tag(),
-    ]
+    arguments: dict[str, Any] = {
+        "dry_run": True,
+        "incremental": False,
+        "unreleased_version": next_version.get_release_tag(),
+    }
     changelog_file = pathlib.Path(path) / "CHANGELOG.md"
     if current_version.get_release_tag() != "v0.0.0" and changelog_file.exists():
-        args.extend(["--start-rev", current_version.get_release_tag()])
+        arguments["start_rev"] = current_version.get_release_tag()
+    if changelog_template:
+        arguments["template"] = changelog_template
+        arguments["extras"] = {"commit_url": f"{url.removesuffix(".git")}/commit/"}
     stdout = io.StringIO()
     try:
-        with (
-            redirect_stdout(stdout),
-            set_working_dir(path),
-            set_system_args(args),
-            set_changelog_template(path, url, args, changelog_template),
-        ):
-            commitizen()
+        with redirect_stdout(stdout), set_working_dir(path):
+            changelog = Changelog(load_config(path), arguments)
+            if changelog_template:
+                set_changelog_template(changelog, changelog_template)
+            changelog()
     except DryRunExit:
         return stdout.getvalue()
     except Exception:
@@ -145,9 +189,5 @@ def get_changelog(
 
 def check(path: pathlib.Path, from_head: str, to_head: str) -> None:
     """Check commit messages formatting."""
-    args = ["cz", "check", "--rev-range", f"{from_head}..{to_head}"]
-    with (
-        set_working_dir(path),
-        set_system_args(args),
-    ):
-        commitizen()
+    with set_working_dir(path):
+        Check(load_config(path), {"rev_range": f"{from_head}..{to_head}"})()
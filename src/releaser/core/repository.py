@@ -2,11 +2,16 @@
 
 import pathlib
 import re
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import git
 
 GitRef = git.Head | git.TagReference | git.RemoteReference | git.Reference
 
+_RELEASE_BRANCH_RE = re.compile(r"v\d+")
+
 
 class GitRepository:
     """Class for interacting with an existing Git repository."""
@@ -14,62 +19,86 @@ class GitRepository:
     def __init__(self, path: pathlib.Path) -> None:
         """Initialize the GitRepository with the path to an existing repository."""
         self.repo = git.Repo(path)
-        if "main" in self.repo.remote().refs:
+        self._remote_obj = self.repo.remote()
+        self._remote_name = self._remote_obj.name
+        self._remote_url = self._remote_obj.url
+        references, remote_branches = self._read_references()
+        self._references: dict[str, GitRef] | None = references
+        if "main" in remote_branches:
             self.default_branch = "main"
-        elif "master" in self.repo.remote().refs:
+        elif "master" in remote_branches:
             self.default_branch = "master"
         else:
             msg = "Default branch not found."
             raise ValueError(msg)
 
-    def _get_remote_refs(self) -> list[git.RemoteReference]:
-        """Get all remote references."""
-        return self.repo.remote().refs
-
-    def find_release_branches(self) -> list[str]:
-        """Find all release branches on the origin remote."""
-        pattern = re.compile(r"origin/v\d+")
-
-        def extract_number(branch: str) -> int:
-            match = re.search(r"\d+", branch)
-            return int(match.group()) if match else -1
+    def _read_references(self) -> tuple[dict[str, GitRef], set[str]]:
+        """Read branch references by name and the remote branch names at once."""
+        heads_prefix = "refs/heads/"
+        remote_prefix = f"refs/remotes/{self._remote_name}/"
+        ref_paths = self.repo.git.for_each_ref(
+            "--format=%(refname)", heads_prefix, remote_prefix
+        ).splitlines()
+        remote_refs = {
+            path.removeprefix(remote_prefix): git.RemoteReference(self.repo, path)
+            for path in ref_paths
+            if path.startswith(remote_prefix)
+        }
+        references: dict[str, GitRef] = dict(remote_refs)
+        references.update(
+            {
+                path.removeprefix(heads_prefix): git.Head(self.repo, path)
+                for path in ref_paths
+                if path.startswith(heads_prefix)
+            }
+        )
+        return references, set(remote_refs)
 
-        release_branches = [
-            branch.name.replace("origin/", "")
-            for branch in self._get_remote_refs()
-            if pattern.match(branch.name)
-        ]
+    def _clear_references(self) -> None:
+        """Forget cached references after branches changed."""
+        self._references = None
 
-        return sorted(release_branches, key=extract_number, reverse=True)
+    def find_release_branches(self) -> list[str]:
+        """Find all release branches on the remote, newest version first."""
+        remote_prefix = f"refs/remotes/{self._remote_name}/"
+        remote_branches = self.repo.git.for_each_ref(
+            "--format=%(refname)", "--sort=-v:refname", f"{remote_prefix}v*"
+        ).splitlines()
+        branches = [branch.removeprefix(remote_prefix) for branch in remote_branches]
+        return [branch for branch in branches if _RELEASE_BRANCH_RE.fullmatch(branch)]
 
     def _remote(self, branch_name: str) -> str:
         """Format a branch name with the remote name."""
-        return f"{self.repo.remote().name}/{branch_name}"
+        return f"{self._remote_name}/{branch_name}"
 
     def find_first_commit(self) -> git.Commit:
         """Find the first commit in the default branch."""
-        return next(
-            self.repo.iter_commits(rev=self._remote(self.default_branch), max_parents=0)
+        root_commits = self.repo.git.rev_list(
+            "--max-parents=0", self._remote(self.default_branch)
         )
+        return self.repo.commit(root_commits.splitlines()[0])
 
     def get_workdir(self) -> pathlib.Path:
         """Get the working directory of the repository."""
         return pathlib.Path(str(self.repo.working_tree_dir))
 
-    def _checkout_clean(self, head: GitRef | git.HEAD) -> None:
-        if isinstance(head, GitRef):
-            head.checkout()
-        self.repo.head.reset(index=True, working_tree=True)
+    def _checkout_clean(self, head: git.Head) -> None:
+        """Check out a local branch and remove untracked files."""
+        self.repo.git.checkout("--force", head.name)
         self.repo.git.clean("-fd")
 
+    def _create_tracking_head(self, remote_ref: git.RemoteReference) -> git.Head:
+        """Create a local branch tracking a remote branch."""
+        head = self.repo.create_head(remote_ref.remote_head, remote_ref)
+        head.set_tracking_branch(remote_ref)
+        self._clear_references()
+        return head
+
     def checkout(self, branch: str, on_branch: str = "HEAD") -> None:
         """Checkout a branch or create and checkout a new branch based on 'on'."""
         head_ref = self.find_reference(branch)
         if isinstance(head_ref, git.RemoteReference):
-            name = head_ref.name.replace("origin/", "")
-            head = self.repo.create_head(name, head_ref)
-            head.set_tracking_branch(head_ref)
-            self._checkout_clean(head)
+            self._checkout_clean(self._create_tracking_head(head_ref))
         elif isinstance(head_ref, git.Head):
             self._checkout_clean(head_ref)
         else:
@@ -79,16 +108,19 @@ class GitRepository:
             else:
                 head = self.repo.create_head(branch, on_branch)
             self._checkout_clean(head)
+        self._clear_references()
+
+    def _get_references(self) -> dict[str, GitRef]:
+        """Get local and remote branch references by branch name."""
+        if self._references is None:
+            self._references, _ = self._read_references()
+        return self._references
 
     def find_reference(self, branch: str) -> GitRef | None:
         """Find and return a branch reference."""
         if branch == "HEAD":
             return self.repo.head.reference
-        if branch in self.repo.branches:
-            return self.repo.branches[branch]
-        if branch in self.repo.remote().refs:
-            return self.repo.remote().refs[branch]
-        return None
+        return self._get_references().get(branch)
 
     def commit(self, files: list[pathlib.Path], message: str) -> git.Commit:
         """Commit the specified files with a message."""
@@ -99,10 +131,10 @@ class GitRepository:
         """Create an annotated tag for a commit."""
         return self.repo.create_tag(tag, str(commit), message)
 
-    def merge(
-        self, source_branch: str, target_branch: str, message: str | None = None
-    ) -> None:
-        """Merge a source branch into a target branch."""
+    def _find_merge_references(
+        self, source_branch: str, target_branch: str
+    ) -> tuple[GitRef, GitRef]:
+        """Find the source and target references of a merge."""
         source_reference = self.find_reference(source_branch)
         if not source_reference:
             msg = "Could not find source branch head."
@@ -113,30 +145,77 @@ class GitRepository:
             msg = "Could not find target branch head."
             raise RuntimeError(msg)
 
-        self._checkout_clean(target_reference)
-        merge_base = self.repo.merge_base(source_reference, target_reference)
-        self.repo.index.merge_tree(source_reference, base=merge_base)
+        return source_reference, target_reference
+
+    def _create_merge_commit(
+        self, source_reference: GitRef, target_reference: GitRef, message: str
+    ) -> str:
+        """Write the merge result of two references into a new commit object."""
+        target_sha = target_reference.commit.hexsha
+        source_sha = source_reference.commit.hexsha
+        merge_output = self.repo.git.merge_tree("--write-tree", target_sha, source_sha)
+        tree_sha = merge_output.splitlines()[0]
+        return self.repo.git.commit_tree(
+            tree_sha, "-p", target_sha, "-p", source_sha, "-m", message
+        )
+
+    def create_merge_commit(
+        self, source_branch: str, target_branch: str, message: str | None = None
+    ) -> git.Commit:
+        """
+        Create a merge commit without updating a branch or the working tree.
+
+        Returns the target commit itself if the source is already merged into it.
+        """
+        source_reference, target_reference = self._find_merge_references(
+            source_branch, target_branch
+        )
+        if self.repo.is_ancestor(source_reference.commit, target_reference.commit):
+            return target_reference.commit
+        if not message:
+            message = f"Merge `{source_branch}` into `{target_branch}`"
+        merge_commit = self._create_merge_commit(
+            source_reference, target_reference, message
+        )
+        return self.repo.commit(merge_commit)
+
+    @contextmanager
+    def temporary_worktree(self, commit: git.Commit) -> Iterator[pathlib.Path]:
+        """Check out a commit into a detached worktree removed afterwards."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workdir = pathlib.Path(temp_dir) / "worktree"
+            self.repo.git.worktree("add", "--detach", str(workdir), commit.hexsha)
+            try:
+                yield workdir
+            finally:
+                self.repo.git.worktree("remove", "--force", str(workdir))
+
+    def merge(
+        self, source_branch: str, target_branch: str, message: str | None = None
+    ) -> None:
+        """Merge a source branch into a target branch."""
+        source_reference, target_reference = self._find_merge_references(
+            source_branch, target_branch
+        )
+        if isinstance(target_reference, git.RemoteReference):
+            target_reference = self._create_tracking_head(target_reference)
+
         if not message:
             message = f"Merge `{source_branch}` into `{target_branch}`"
-        self.repo.index.commit(
-            message,
-            parent_commits=[target_reference.commit, source_reference.commit],
+        merge_commit = self._create_merge_commit(
+            source_reference, target_reference, message
+        )
+        self.repo.git.update_ref(
+            target_reference.path, merge_commit, target_reference.commit.hexsha
         )
-        self._checkout_clean(self.repo.head)
+        if not self.repo.head.is_detached and self.repo.head.ref == target_reference:
+            self.repo.git.reset("--hard")
 
     def push(self, ref_names: list[str], *, dry_run: bool) -> None:
         """Push the references identified by their names to the origin remote."""
-        self.repo.remote().push(ref_names, dry_run=dry_run)
-
-    def delete(self, branch: str) -> None:
-        """Delete the specified branch after checking out the default branch."""
-        if branch not in self.repo.heads:
-            return
-        default_branch = self.find_reference(self.default_branch)
-        if default_branch:
-            self._checkout_clean(default_branch)
-            self.repo.delete_head(branch, force=True)
+        self._remote_obj.push(ref_names, dry_run=dry_run)
+        self._clear_references()
 
     def get_url(self) -> str:
         """Get remote URL."""
-        return self.repo.remote().url
+        return self._remote_url
@@ -6,14 +6,18 @@ from packaging.version import Version as SemVer
 class Version:
     """Interact with semantic version."""
 
+    __slots__ = ("_branch", "_tag", "version")
+
     def __init__(self, base_version: str) -> None:
         """Initialize from base version string."""
         self.version = SemVer(base_version)
+        self._branch = f"v{self.version.major}"
+        self._tag = f"v{self.version.base_version}"
 
     def get_release_branch(self) -> str:
         """Get release branch from semantic version."""
-        return f"v{self.version.major}"
+        return self._branch
 
     def get_release_tag(self) -> str:
         """Get release tag from semantic version."""
-        return f"v{self.version.base_version}"
+        return self._tag
@@ -0,0 +1,77 @@
+import datetime
+import os
+import pathlib
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from src.releaser import cli
+
+from .helper import GITCONFIG, Origin, temporary_env
+
+OriginFactory = Callable[..., Origin]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _git_config(tmp_path_factory) -> Iterator[None]:
+    home = tmp_path_factory.mktemp("home")
+    gitconfig = home / ".gitconfig"
+    gitconfig.write_text(GITCONFIG)
+    env_vars = {
+        "HOME": str(home),
+        "GIT_CONFIG_GLOBAL": str(gitconfig),
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "GIT_TEST_FSYNC": "0",
+    }
+    with temporary_env(env_vars):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_parser() -> None:
+    cli.parse(["check", "-f", "main", "repo/path"])
+
+
+@pytest.fixture()
+def changelog_date(monkeypatch) -> Callable[[datetime.date], None]:
+    def set_changelog_date(today: datetime.date) -> None:
+        class FixedDate(datetime.date):
+            @classmethod
+            def today(cls) -> datetime.date:
+                return today
+
+        monkeypatch.setattr("commitizen.changelog.date", FixedDate)
+
+    return set_changelog_date
+
+
+@pytest.fixture(scope="session")
+def origin_seed(tmp_path_factory) -> Callable[[str], Origin]:
+    seeds: dict[str, Origin] = {}
+
+    def get_seed(default_branch: str) -> Origin:
+        if default_branch not in seeds:
+            worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+            seed_dir = tmp_path_factory.mktemp(
+                f"origin-seed-{worker_id}-{default_branch}"
+            )
+            seeds[default_branch] = Origin(seed_dir, default_branch)
+        return seeds[default_branch]
+
+    return get_seed
+
+
+@pytest.fixture()
+def origin_factory(request, origin_seed) -> OriginFactory:
+    def create_origin(
+        default_branch: str = "main",
+        additional_branches: list[str] | None = None,
+        base_dir: pathlib.Path | None = None,
+    ) -> Origin:
+        if base_dir is None:
+            base_dir = request.getfixturevalue("tmp_path")
+        return Origin.from_seed(
+            origin_seed(default_branch), base_dir, additional_branches
+        )
+
+    return create_origin
@@ -1,21 +1,44 @@
+import os
+import pathlib
 from unittest.mock import patch
 
 import pytest
 
 from src.releaser.core import commits
 from src.releaser.core.version import Version
-from tests.helper import COMMIT_URL
+from tests.helper import COMMIT_URL, CZ_JSON
 
 
-@patch("src.releaser.core.commits.commitizen")
-def test_bump_no_exception_raised(mock_commitizen, tmp_path) -> None:
+@patch("src.releaser.core.commits.Bump")
+def test_bump_no_exception_raised(mock_bump, tmp_path) -> None:
     with pytest.raises(RuntimeError):
         commits.bump(tmp_path)
 
 
+def test_bump_log_keeps_version_line() -> None:
+    bump_log = commits.BumpLog()
+    assert bump_log.writable()
+    bump_log.write("bump: version 0.1.0 → 0.2.0\ntag to cre")
+    bump_log.write("ate: v0.2.0\nincrement detected: MINOR\n")
+    bump_log.write("tag to create: v9.9.9\n")
+    assert bump_log.version_line == "tag to create: v0.2.0"
+
+
 def test_extract_version_malformed() -> None:
     with pytest.raises(RuntimeError):
         commits.extract_version("")
+    with pytest.raises(RuntimeError):
+        commits.extract_version("tag to create: vX.Y.Z")
+
+
+def test_extract_version() -> None:
+    log = "bump: version 0.1.1 → 1.0.0\ntag to create: v1.0.0\nincrement: MAJOR"
+    assert commits.extract_version(log).get_release_tag() == "v1.0.0"
+
+
+def test_extract_version_uses_first_mention() -> None:
+    log = "tag to create: v1.0.0\n- docs: mention tag to create: vX.Y.Z"
+    assert commits.extract_version(log).get_release_tag() == "v1.0.0"
 
 
 def test_get_current_version(tmp_path) -> None:
@@ -23,20 +46,43 @@ def test_get_current_version(tmp_path) -> None:
         commits.get_current_version(tmp_path)
 
 
-@patch("src.releaser.core.commits.commitizen")
+def test_get_current_version_follows_new_tags(origin_factory) -> None:
+    origin = origin_factory()
+    origin.commit(".cz.json", CZ_JSON, "docs: v0.0.0")
+    repo = origin.clone()
+    path = pathlib.Path(repo.working_tree_dir)
+    assert commits.get_current_version(path).get_release_tag() == "v0.0.0"
+
+    repo.create_tag("v0.1.0", message="v0.1.0")
+    assert commits.get_current_version(path).get_release_tag() == "v0.1.0"
+
+
+@patch("src.releaser.core.commits.Changelog")
 @patch("src.releaser.core.commits.get_current_version")
 def test_get_changelog_exception_raised(
-    mock_get_current_version, mock_commitizen, tmp_path
+    mock_get_current_version, mock_changelog, tmp_path
 ) -> None:
-    mock_commitizen.side_effect = Exception("Test exception")
+    mock_changelog.side_effect = Exception("Test exception")
     with pytest.raises(Exception, match="Test exception"):
         commits.get_changelog(tmp_path, COMMIT_URL, Version("0.1.0"), None)
 
 
-@patch("src.releaser.core.commits.commitizen")
+@patch("src.releaser.core.commits.Changelog")
 @patch("src.releaser.core.commits.get_current_version")
 def test_get_changelog_no_exception_raised(
-    mock_get_current_version, mock_commitizen, tmp_path
+    mock_get_current_version, mock_changelog, tmp_path
 ) -> None:
     with pytest.raises(RuntimeError):
         commits.get_changelog(tmp_path, COMMIT_URL, Version("0.1.0"), None)
+
+
+def test_load_config_reused_until_changed(tmp_path) -> None:
+    config_file = tmp_path / ".cz.json"
+    config_file.write_text(CZ_JSON)
+    config = commits.load_config(tmp_path)
+    assert config.settings["tag_format"] == "v$version"
+    assert commits.load_config(tmp_path) is config
+
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert commits.load_config(tmp_path) is not config
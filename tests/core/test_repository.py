@@ -1,51 +1,70 @@
-import pathlib
-
 import pytest
 
 from src.releaser.core.repository import GitRepository
-from tests.helper import Origin
 
 
-def test_master_branch(tmp_path: pathlib.Path) -> None:
-    path = Origin(tmp_path, default_branch="master").clone().working_tree_dir
+def test_master_branch(origin_factory) -> None:
+    path = origin_factory(default_branch="master").clone().working_tree_dir
     repo = GitRepository(path)
     assert repo.repo.head.reference.name == "master"
 
 
-def test_broken_default_branch(tmp_path: pathlib.Path) -> None:
-    path = Origin(tmp_path, default_branch="something-else").clone().working_tree_dir
+def test_broken_default_branch(origin_factory) -> None:
+    path = origin_factory(default_branch="something-else").clone().working_tree_dir
     with pytest.raises(ValueError, match="Default branch not found."):
         GitRepository(path)
 
 
-def test_checkout_head(tmp_path: pathlib.Path) -> None:
-    path = Origin(tmp_path).clone().working_tree_dir
+def test_checkout_head(origin_factory) -> None:
+    path = origin_factory().clone().working_tree_dir
     repo = GitRepository(path)
     repo.checkout("HEAD")
     assert repo.repo.head.reference.name == "main"
 
 
-def test_merge_source_branch_doesnt_exist(tmp_path: pathlib.Path) -> None:
-    path = Origin(tmp_path).clone().working_tree_dir
+def test_checkout_remote_branch(origin_factory) -> None:
+    path = origin_factory(additional_branches=["v0"]).clone().working_tree_dir
+    repo = GitRepository(path)
+    repo.checkout("v0")
+    assert repo.repo.head.reference.name == "v0"
+    assert repo.repo.head.reference.tracking_branch().name == "origin/v0"
+
+
+def test_merge_source_branch_doesnt_exist(origin_factory) -> None:
+    path = origin_factory().clone().working_tree_dir
     repo = GitRepository(path)
     with pytest.raises(RuntimeError, match="Could not find source branch head."):
         repo.merge("doesnt_exist", "v0", "Merge main into v0")
 
 
-def test_merge_target_branch_doesnt_exist(tmp_path: pathlib.Path) -> None:
-    path = Origin(tmp_path).clone().working_tree_dir
+def test_merge_target_branch_doesnt_exist(origin_factory) -> None:
+    path = origin_factory().clone().working_tree_dir
     repo = GitRepository(path)
     with pytest.raises(RuntimeError, match="Could not find target branch head."):
         repo.merge("main", "v0", "Merge main into v0")
 
 
-def test_clean_repository_after_merge(tmp_path: pathlib.Path) -> None:
+def test_merge_into_branch_only_on_remote(origin_factory) -> None:
+    origin = origin_factory(additional_branches=["v0"])
+    origin.commit("README.md", "commit in main", "docs: something")
+    path = origin.clone().working_tree_dir
+    repo = GitRepository(path)
+    remote_v0 = repo.repo.remotes.origin.refs["v0"].commit
+
+    repo.merge("main", "v0")
+
+    assert repo.repo.remotes.origin.refs["v0"].commit == remote_v0
+    assert repo.repo.heads["v0"].tracking_branch().name == "origin/v0"
+    assert repo.repo.heads["v0"].commit.parents[0] == remote_v0
+
+
+def test_clean_repository_after_merge(origin_factory) -> None:
     # * chore: delete file (origin/chore/delete-file)
     # | * docs: something (HEAD -> main, origin/main)
     # |/
     # * chore: add file
     # * first commit
-    origin = Origin(tmp_path)
+    origin = origin_factory()
     origin.commit("file_to_be_deleted.txt", "to be deleted", "chore: add file")
     origin.create_branch("chore/delete-file")
     origin.commit("README.md", "another unrelated commit in main", "docs: something")
@@ -60,7 +79,51 @@ def test_clean_repository_after_merge(tmp_path: pathlib.Path) -> None:
     assert [diff.a_path for diff in repo.repo.index.diff(None)] == []
 
 
-def test_get_url(tmp_path: pathlib.Path) -> None:
-    path = Origin(tmp_path).clone().working_tree_dir
+def test_get_url(origin_factory) -> None:
+    path = origin_factory().clone().working_tree_dir
     repo = GitRepository(path)
     assert repo.get_url() != ""
+
+
+def test_merge_commit_in_temporary_worktree(origin_factory) -> None:
+    origin = origin_factory()
+    origin.create_branch("v0")
+    origin.commit("README.md", "commit in main", "docs: something")
+
+    path = origin.clone().working_tree_dir
+    repo = GitRepository(path)
+    head = repo.repo.head.commit
+
+    merge_commit = repo.create_merge_commit("main", "v0")
+    with repo.temporary_worktree(merge_commit) as workdir:
+        assert (workdir / "README.md").read_text() == "commit in main"
+
+    assert not workdir.exists()
+    assert repo.repo.head.commit == head
+    assert [parent.hexsha for parent in merge_commit.parents] == [
+        repo.find_reference("v0").commit.hexsha,
+        head.hexsha,
+    ]
+    assert repo.repo.git.worktree("list").count("\n") == 0
+
+
+def test_merge_into_branch_not_checked_out(origin_factory) -> None:
+    origin = origin_factory()
+    origin.create_branch("v0")
+    origin.commit("README.md", "commit in main", "docs: something")
+
+    path = origin.clone(["v0", "main"]).working_tree_dir
+    repo = GitRepository(path)
+
+    repo.merge("main", "v0")
+
+    assert repo.repo.head.reference.name == "main"
+    assert repo.repo.heads["v0"].commit.message == "Merge `main` into `v0`\n"
+    assert repo.repo.heads["v0"].commit.tree == repo.repo.heads["main"].commit.tree
+
+
+def test_find_release_branches(origin_factory) -> None:
+    origin = origin_factory(additional_branches=["v2", "v10", "v9", "vnext"])
+    path = origin.clone().working_tree_dir
+    repo = GitRepository(path)
+    assert repo.find_release_branches() == ["v10", "v9", "v2"]
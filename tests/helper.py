@@ -1,13 +1,13 @@
 import argparse
 import os
 import pathlib
+import shutil
 import subprocess
-import uuid
 from collections.abc import Iterator
 from contextlib import contextmanager
 
 import git
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import DictLoader, Environment
 
 from src.releaser import cli
 
@@ -23,14 +23,34 @@ CZ_JSON = """
     }
 }
 """
+CZ_JSON_BYTES = CZ_JSON.encode()
+_README_BYTES = b"# test"
+GITCONFIG = """
+[user]
+    name = Test User
+    email = test@example.com
+[commit]
+    gpgsign = false
+[tag]
+    gpgsign = false
+[core]
+    fsync = none
+"""
 RESOURCES_DIR = pathlib.Path(__file__).parent / "resources"
+_TEMPLATES = {path.name: path.read_text() for path in RESOURCES_DIR.glob("*.j2")}
+_JINJA_ENV = Environment(
+    loader=DictLoader(_TEMPLATES), autoescape=True, auto_reload=False
+)
+for _template_name in _TEMPLATES:
+    _JINJA_ENV.get_template(_template_name)
 
 
 class Origin:
     """
     Simulates a git remote origin for testing purposes.
 
-    Sets up an origin in a separate local directory.
+    Sets up an origin in a separate local directory, or reuses the origin
+    already copied there by from_seed().
     Provides a clone() method similar to 'git clone'.
     Provides a commit() method to commit directly to the origin.
     """
@@ -45,40 +65,64 @@ class Origin:
         self.base_dir = base_dir
         self.default_branch = default_branch
         self.origin_dir = base_dir / "origin"
-        self.origin_repo = self._init_origin()
-        self._setup_default_branch()
+        self._clone_seq = 0
+        self._work_clones: dict[str, git.Repo] = {}
+        self._cache_clone: git.Repo | None = None
+        self._worktree: tuple[str, pathlib.Path] | None = None
+        if not self.origin_dir.exists():
+            self._init_origin()
+            self._setup_default_branch()
         if additional_branches:
             for branch in additional_branches:
                 self.create_branch(branch)
 
-    def _init_origin(self) -> git.Repo:
+    @classmethod
+    def from_seed(
+        cls,
+        seed: "Origin",
+        base_dir: pathlib.Path,
+        additional_branches: list[str] | None = None,
+    ) -> "Origin":
+        """Copy the origin repository of a seed instead of setting it up again."""
+        shutil.copytree(seed.origin_dir, base_dir / "origin")
+        return cls(base_dir, seed.default_branch, additional_branches)
+
+    def _init_origin(self) -> None:
         self.origin_dir.mkdir()
-        return git.Repo.init(self.origin_dir, bare=True)
+        git.Repo.init(self.origin_dir, bare=True, initial_branch=self.default_branch)
 
     def _setup_default_branch(self) -> None:
         setup_dir = self.base_dir / "setup"
         setup_dir.mkdir()
-        repo = git.Repo.init(setup_dir)
-        self._commit_file(repo, "README.md", "# test", "first commit")
-        repo.heads[0].rename(self.default_branch)
+        repo = git.Repo.init(setup_dir, initial_branch=self.default_branch)
+        self._commit_file(repo, "README.md", _README_BYTES, "first commit")
         repo.create_remote("origin", self.origin_dir).push(self.default_branch)
 
     def create_branch(self, branch_name: str, base: str = "HEAD") -> None:
-        repo = self.clone()
+        repo = self._ensure_work_clone(self.default_branch)
         repo.create_head(branch_name, base)
         repo.remotes.origin.push(branch_name)
 
     @staticmethod
     def _commit_file(
-        repo: git.Repo, file_name: str, content: str, message: str
+        repo: git.Repo, file_name: str, content: bytes | str, message: str
     ) -> git.Commit:
         file_path = pathlib.Path(repo.working_tree_dir) / file_name
-        file_path.write_text(content)
-        repo.index.add([file_path])
-        return repo.index.commit(message)
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+        else:
+            file_path.write_text(content)
+        repo.git.add(str(file_path))
+        return Origin._commit_staged(repo, message)
+
+    @staticmethod
+    def _commit_staged(repo: git.Repo, message: str) -> git.Commit:
+        repo.git.commit("-m", message, "--no-verify", "--no-gpg-sign")
+        return repo.head.commit
 
     def clone(self, branches: list[str] | None = None) -> git.Repo:
-        clone_dir = self.base_dir / str(uuid.uuid4())
+        self._clone_seq += 1
+        clone_dir = self.base_dir / f"clone-{self._clone_seq}"
         clone_dir.mkdir()
         repo = git.Repo.init(clone_dir)
         origin = repo.create_remote("origin", self.origin_dir)
@@ -90,30 +134,74 @@ class Origin:
             ).checkout()
         return repo
 
+    def _ensure_work_clone(self, branch: str) -> git.Repo:
+        repo = self._work_clones.get(branch)
+        if repo is None:
+            repo = self._work_clones[branch] = self.clone([branch])
+        else:
+            repo.remotes.origin.fetch()
+            repo.git.checkout("--force", "-B", branch, f"origin/{branch}")
+        return repo
+
+    def worktree(self, branch: str) -> pathlib.Path:
+        """
+        Check out an origin branch in a worktree of one shared cached clone.
+
+        Only one worktree exists at a time: each call removes the worktree and
+        local branch of the previous call, so a path returned earlier is no
+        longer valid. This keeps the clone free of other local branches.
+        """
+        if self._cache_clone is None:
+            cache_dir = self.base_dir / "cache-clone"
+            cache_dir.mkdir()
+            self._cache_clone = git.Repo.init(cache_dir)
+            self._cache_clone.create_remote("origin", self.origin_dir)
+        repo = self._cache_clone
+        repo.remotes.origin.fetch(prune=True)
+        if self._worktree is not None:
+            previous_branch, previous_dir = self._worktree
+            repo.git.worktree("remove", "--force", str(previous_dir))
+            repo.git.branch("-D", previous_branch)
+        worktree_dir = self.base_dir / f"worktree-{branch}"
+        repo.git.worktree("add", "-B", branch, str(worktree_dir), f"origin/{branch}")
+        self._worktree = (branch, worktree_dir)
+        return worktree_dir
+
     def commit(
-        self, file_name: str, content: str, message: str, branch: str | None = None
+        self,
+        file_name: str,
+        content: bytes | str,
+        message: str,
+        branch: str | None = None,
     ) -> git.Commit:
         branch = branch or self.default_branch
-        repo = self.clone([branch])
+        repo = self._ensure_work_clone(branch)
         commit = self._commit_file(repo, file_name, content, message)
         repo.remotes.origin.push(branch)
         return commit
 
+    def commit_and_checkout(
+        self,
+        file_name: str,
+        content: bytes | str,
+        message: str,
+        branch: str | None = None,
+    ) -> tuple[git.Commit, pathlib.Path]:
+        """Commit to the origin and return the working clone the commit was made in."""
+        branch = branch or self.default_branch
+        commit = self.commit(file_name, content, message, branch)
+        return commit, pathlib.Path(self._work_clones[branch].working_tree_dir)
+
     def delete(self, file_name: str, message: str, branch: str | None = None) -> None:
         branch = branch or self.default_branch
-        repo = self.clone([branch])
-        file_path = pathlib.Path(repo.working_tree_dir) / file_name
-        file_path.unlink()
-        repo.index.remove([file_path])
-        repo.index.commit(message)
+        repo = self._ensure_work_clone(branch)
+        repo.git.rm(file_name)
+        self._commit_staged(repo, message)
         repo.remotes.origin.push(branch)
 
 
 class ExpectedChangelog:
-    def __init__(
-        self, resource_dir: pathlib.Path = RESOURCES_DIR, commit_url: str = COMMIT_URL
-    ) -> None:
-        self.env = Environment(loader=FileSystemLoader(resource_dir), autoescape=True)
+    def __init__(self, commit_url: str = COMMIT_URL) -> None:
         self.context = {}
         self.context["commit_url"] = f"{commit_url}/commit/"
 
@@ -122,26 +210,33 @@ class ExpectedChangelog:
         return self
 
     def render(self, template_file: str) -> str:
-        template = self.env.get_template(template_file)
-        return template.render(self.context)
-
-
-def git_graph(repo_path: pathlib.Path) -> str:
-    return subprocess.run(
-        [
-            "/usr/bin/git",
-            "log",
-            "--graph",
-            "--oneline",
-            "--all",
-            "--decorate",
-            "--pretty=format:%s%C(auto)%d%C(reset)",
-        ],
-        cwd=repo_path,
-        text=True,
-        capture_output=True,
-        check=True,
-    ).stdout
+        return _JINJA_ENV.get_template(template_file).render(self.context)
+
+
+def git_graph(repo_path: pathlib.Path, output_file: pathlib.Path) -> pathlib.Path:
+    """Write the decorated commit graph of a repository into a file."""
+    with output_file.open("wb") as output:
+        subprocess.run(
+            [
+                "/usr/bin/git",
+                "log",
+                "--graph",
+                "--oneline",
+                "--all",
+                "--decorate",
+                "--pretty=format:%s%C(auto)%d%C(reset)",
+            ],
+            cwd=repo_path,
+            stdout=output,
+            check=True,
+            env={
+                **os.environ,
+                "LC_ALL": "C",
+                "GIT_OPTIONAL_LOCKS": "0",
+                "GIT_PAGER": "cat",
+            },
+        )
+    return output_file
 
 
 def parse_github_output(github_output_path: pathlib.Path) -> dict[str, str]:
@@ -154,24 +249,25 @@ def parse_github_output(github_output_path: pathlib.Path) -> dict[str, str]:
     Returns:
     dict: A dictionary containing the parsed key-value pairs.
     """
-    output_dict = {}
-    output_text = github_output_path.read_text()
-    for line in output_text.splitlines():
-        if "=" in line:
-            key, value = line.split("=", 1)
-            output_dict[key] = value
-    return output_dict
+    return dict(
+        line.split("=", 1)
+        for line in github_output_path.read_text().splitlines()
+        if "=" in line
+    )
 
 
 @contextmanager
 def temporary_env(variables: dict[str, str]) -> Iterator[None]:
-    original_env = os.environ.copy()
+    saved = {name: os.environ.get(name) for name in variables}
     os.environ.update(variables)
     try:
         yield
     finally:
-        os.environ.clear()
-        os.environ.update(original_env)
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
 
 
 def run_releaser(
@@ -181,7 +277,7 @@ def run_releaser(
     source: str = "main",
     dry_run: bool = False,
 ) -> None:
-    args = argparse.Namespace
+    args = argparse.Namespace()
     args.repository = repository
     args.source = source
     args.dry_run = dry_run
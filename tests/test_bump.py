@@ -1,3 +1,4 @@
+import logging
 import pathlib
 from unittest.mock import patch
 
@@ -6,11 +7,11 @@ import pytest
 from src.releaser import bump
 from src.releaser.core.repository import GitRepository
 
-from .helper import CZ_JSON, Origin
+from .helper import CZ_JSON, run_releaser
 
 
-def test_no_version_bump(tmp_path: pathlib.Path) -> None:
-    origin = Origin(tmp_path)
+def test_no_version_bump(origin_factory) -> None:
+    origin = origin_factory()
     origin.commit(".cz.json", CZ_JSON, "docs: v0.0.0")
 
     path = origin.clone().working_tree_dir
@@ -21,10 +22,30 @@ def test_no_version_bump(tmp_path: pathlib.Path) -> None:
     assert changelog is None
 
 
-@patch("src.releaser.core.commits.commitizen")
-def test_unexpected_exception(mock_commitizen, tmp_path: pathlib.Path) -> None:
-    mock_commitizen.side_effect = Exception("Unexpected exception")
-    path = Origin(tmp_path).clone().working_tree_dir
+def test_source_already_released(
+    tmp_path: pathlib.Path, origin_factory, caplog
+) -> None:
+    origin = origin_factory()
+    origin.commit(".cz.json", CZ_JSON, "feat: add a feature")
+    run_releaser(tmp_path, origin.clone().working_tree_dir)
+
+    path = origin.clone().working_tree_dir
+    repo = GitRepository(path)
+    caplog.set_level(logging.INFO)
+    with patch.object(repo, "_create_merge_commit") as mock_merge_commit:
+        next_version, changelog = bump.bump(repo, "main", None)
+
+    mock_merge_commit.assert_not_called()
+    assert "Skipping merge, 'main' is already merged into 'v0'." in caplog.text
+    assert "Merged 'main'" not in caplog.text
+    assert next_version is None
+    assert changelog is None
+
+
+@patch("src.releaser.core.commits.Bump")
+def test_unexpected_exception(mock_bump, origin_factory) -> None:
+    mock_bump.side_effect = Exception("Unexpected exception")
+    path = origin_factory().clone().working_tree_dir
     repo = GitRepository(path)
     with pytest.raises(Exception, match="Unexpected exception"):
         bump.bump(repo, "main", None)
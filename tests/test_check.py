@@ -1,4 +1,5 @@
 import argparse
+import re
 
 import pytest
 from commitizen.exceptions import InvalidCommitMessageError
@@ -6,18 +7,18 @@ from commitizen.exceptions import InvalidCommitMessageError
 from src.releaser import check, cli
 from src.releaser.core.repository import GitRepository
 
-from .helper import Origin
+_NONEXISTING_RE = re.compile(r"Could not find branch 'non-existing'\.")
 
 
-def test_check_success(tmp_path) -> None:
-    origin = Origin(tmp_path, additional_branches=["feat/branch"])
+def test_check_success(origin_factory) -> None:
+    origin = origin_factory(additional_branches=["feat/branch"])
     origin.commit(
         "README.md", "feature commit in feature branch", "feat: branch", "feat/branch"
     )
 
     path = origin.clone(["main", "feat/branch"]).working_tree_dir
 
-    args = argparse.Namespace
+    args = argparse.Namespace()
     args.repository = path
     args.action = "check"
     args.check_from = "main"
@@ -25,8 +26,8 @@ def test_check_success(tmp_path) -> None:
     cli.main(args)
 
 
-def test_check_incorrect_commit_message(tmp_path) -> None:
-    origin = Origin(tmp_path, additional_branches=["feat/branch"])
+def test_check_incorrect_commit_message(origin_factory) -> None:
+    origin = origin_factory(additional_branches=["feat/branch"])
     origin.commit(
         "README.md",
         "feature commit in feature branch",
@@ -41,10 +42,10 @@ def test_check_incorrect_commit_message(tmp_path) -> None:
         check.check(repo, "main")
 
 
-def test_check_from_nonexisting(tmp_path) -> None:
-    origin = Origin(tmp_path)
+def test_check_from_nonexisting(origin_factory) -> None:
+    origin = origin_factory()
     path = origin.clone().working_tree_dir
     repo = GitRepository(path)
 
-    with pytest.raises(ValueError, match="Could not find branch 'non-existing'."):
+    with pytest.raises(ValueError, match=_NONEXISTING_RE):
         check.check(repo, "non-existing")
@@ -1,9 +1,14 @@
 import pathlib
+import re
 
 import pytest
 
 from src.releaser import cli
 
+from .helper import CZ_JSON, parse_github_output, run_releaser
+
+_MISSING_ENV_RE = re.compile(r"The environment variable 'missing' is not set\.")
+
 
 def test_parse_release() -> None:
     args = cli.parse(
@@ -35,6 +40,14 @@ def test_parse_changelog_template() -> None:
     assert args.changelog_template == "github_linked_sha.md.j2"
 
 
+def test_parse_unknown_changelog_template(capsys) -> None:
+    with pytest.raises(SystemExit):
+        cli.parse(["release", "-t", "unknown.md.j2", "repo/path"])
+    err = capsys.readouterr().err
+    assert "unknown.md.j2" in err
+    assert "github_linked_sha.md.j2" in err
+
+
 def test_parse_check() -> None:
     args = cli.parse(["check", "-f", "master", "repo/path"])
     assert args.repository == pathlib.Path("repo/path")
@@ -43,7 +56,16 @@ def test_parse_check() -> None:
 
 
 def test_missing_environment_variable() -> None:
-    with pytest.raises(
-        KeyError, match="The environment variable 'missing' is not set."
-    ):
+    with pytest.raises(KeyError, match=_MISSING_ENV_RE):
         cli.get_env_variable("missing")
+
+
+def test_release_not_ready(tmp_path, origin_factory) -> None:
+    origin = origin_factory()
+    origin.commit(".cz.json", CZ_JSON, "docs: v0.0.0")
+
+    run_releaser(tmp_path, origin.clone().working_tree_dir)
+
+    github_output = tmp_path / "github_output.txt"
+    assert github_output.read_text() == "ready=false\n"
+    assert parse_github_output(github_output) == {"ready": "false"}
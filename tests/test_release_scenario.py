@@ -1,12 +1,13 @@
+import datetime
+import filecmp
 import pathlib
 from unittest.mock import patch
 
-import freezegun
 import pytest
 
 from .helper import (
     COMMIT_URL,
-    CZ_JSON,
+    CZ_JSON_BYTES,
     RESOURCES_DIR,
     ExpectedChangelog,
     Origin,
@@ -16,43 +17,50 @@ from .helper import (
 )
 
 
+@pytest.fixture(scope="module")
+def scenario_path(tmp_path_factory) -> pathlib.Path:
+    return tmp_path_factory.mktemp("scenario")
+
+
 @pytest.fixture()
-@freezegun.freeze_time("2024-08-01")
 @patch("src.releaser.core.repository.GitRepository.get_url", return_value=COMMIT_URL)
-def test_release_v010(mock_url, tmp_path) -> Origin:
-    # GIVEN: Remote origin with feature commit in main branch
-    origin = Origin(tmp_path)
-    commit = origin.commit(".cz.json", CZ_JSON, "feat(scope1): add a new feature")
+def test_release_v010(
+    mock_url, scenario_path, origin_factory, changelog_date
+) -> Origin:
+    changelog_date(datetime.date(2024, 8, 1))
 
-    # GIVEN: Local clone of origin
-    repo_path = origin.clone().working_tree_dir
+    # GIVEN: Remote origin with feature commit in main branch
+    origin = origin_factory(base_dir=scenario_path)
+    commit, repo_path = origin.commit_and_checkout(
+        ".cz.json", CZ_JSON_BYTES, "feat(scope1): add a new feature"
+    )
 
     # WHEN: Releaser is run on local clone
-    run_releaser(tmp_path, repo_path)
+    run_releaser(scenario_path, repo_path)
 
     # THEN: Origin has release branch
-    assert_repo_path = origin.clone(["v0"]).working_tree_dir
+    assert_repo_path = origin.worktree("v0")
 
     # THEN: Git graph has expected structure
-    git_graph_result = git_graph(assert_repo_path)
-    assert (
-        git_graph_result == (RESOURCES_DIR / "test_scenario_log_v010.txt").read_text()
+    git_graph_file = git_graph(assert_repo_path, scenario_path / "graph_v010.txt")
+    assert filecmp.cmp(
+        git_graph_file, RESOURCES_DIR / "test_scenario_log_v010.txt", shallow=False
     )
 
     # THEN: Committed file exists in release branch and has expected content
-    committed_file = pathlib.Path(assert_repo_path) / ".cz.json"
+    committed_file = assert_repo_path / ".cz.json"
     assert committed_file.exists()
-    assert committed_file.read_text() == CZ_JSON
+    assert committed_file.read_bytes() == CZ_JSON_BYTES
 
     # THEN: Changelog exists and has expected content
-    actual_changelog = pathlib.Path(assert_repo_path) / "CHANGELOG.md"
+    actual_changelog = assert_repo_path / "CHANGELOG.md"
     expected_changelog = ExpectedChangelog().add("commit_sha_1", str(commit))
     assert actual_changelog.read_text() == expected_changelog.render(
         "changelog_v010.md.j2"
     )
 
     # THEN: Github output exists and has expected content
-    github_output_content = parse_github_output(tmp_path / "github_output.txt")
+    github_output_content = parse_github_output(scenario_path / "github_output.txt")
     assert github_output_content.get("ready") == "true"
     assert github_output_content.get("tag") == "v0.1.0"
     assert github_output_content.get("changelog", "").endswith(".md")
@@ -61,44 +69,46 @@ def test_release_v010(mock_url, tmp_path) -> Origin:
 
 
 @pytest.fixture()
-@freezegun.freeze_time("2024-08-02")
 @patch("src.releaser.core.repository.GitRepository.get_url", return_value=COMMIT_URL)
-def test_release_v011(mock_url, test_release_v010, tmp_path) -> Origin:
+def test_release_v011(
+    mock_url, test_release_v010, scenario_path, changelog_date
+) -> Origin:
+    changelog_date(datetime.date(2024, 8, 2))
+
     # GIVEN: Origin with v0.1.0 released
     origin = test_release_v010[0]
 
     # GIVEN: Remote origin with fix commit in main branch
-    commit = origin.commit("README.md", "v0.1.1", "fix: resolve a bug")
-
-    # GIVEN: Local clone of origin
-    repo_path = origin.clone().working_tree_dir
+    commit, repo_path = origin.commit_and_checkout(
+        "README.md", b"v0.1.1", "fix: resolve a bug"
+    )
 
     # WHEN: Releaser is run on local clone
-    run_releaser(tmp_path, repo_path)
+    run_releaser(scenario_path, repo_path)
 
     # THEN: Origin has release branch
-    assert_repo_path = origin.clone(["v0"]).working_tree_dir
+    assert_repo_path = origin.worktree("v0")
 
     # THEN: Git graph has expected structure
-    git_graph_result = git_graph(assert_repo_path)
-    assert (
-        git_graph_result == (RESOURCES_DIR / "test_scenario_log_v011.txt").read_text()
+    git_graph_file = git_graph(assert_repo_path, scenario_path / "graph_v011.txt")
+    assert filecmp.cmp(
+        git_graph_file, RESOURCES_DIR / "test_scenario_log_v011.txt", shallow=False
     )
 
     # THEN: Committed file exists in release branch and has expected content
-    committed_file = pathlib.Path(assert_repo_path) / "README.md"
+    committed_file = assert_repo_path / "README.md"
     assert committed_file.exists()
-    assert committed_file.read_text() == "v0.1.1"
+    assert committed_file.read_bytes() == b"v0.1.1"
 
     # THEN: Changelog exists and has expected content
-    actual_changelog = pathlib.Path(assert_repo_path) / "CHANGELOG.md"
+    actual_changelog = assert_repo_path / "CHANGELOG.md"
     expected_changelog = test_release_v010[1].add("commit_sha_2", str(commit))
     assert actual_changelog.read_text() == expected_changelog.render(
         "changelog_v011.md.j2"
     )
 
     # THEN: Github output exists and has expected content
-    github_output_content = parse_github_output(tmp_path / "github_output.txt")
+    github_output_content = parse_github_output(scenario_path / "github_output.txt")
     assert github_output_content.get("ready") == "true"
     assert github_output_content.get("tag") == "v0.1.1"
     assert github_output_content.get("changelog", "").endswith(".md")
@@ -106,44 +116,47 @@ def test_release_v011(mock_url, test_release_v010, tmp_path) -> Origin:
     return origin, expected_changelog
 
 
-@freezegun.freeze_time("2024-08-03")
+@pytest.mark.xdist_group("release_chain")
 @patch("src.releaser.core.repository.GitRepository.get_url", return_value=COMMIT_URL)
-def test_release_v100(mock_url, test_release_v011, tmp_path) -> None:
+def test_release_v100(
+    mock_url, test_release_v011, scenario_path, changelog_date
+) -> None:
+    changelog_date(datetime.date(2024, 8, 3))
+
     # GIVEN: Origin with v0.1.1 released
     origin = test_release_v011[0]
 
     # GIVEN: Origin with breaking commit in main branch
-    commit = origin.commit("README.md", "breaking change", "feat!: breaking change")
-
-    # GIVEN: Local clone of origin
-    repo_path = origin.clone().working_tree_dir
+    commit, repo_path = origin.commit_and_checkout(
+        "README.md", b"breaking change", "feat!: breaking change"
+    )
 
     # WHEN: Releaser is run on local clone
-    run_releaser(tmp_path, repo_path)
+    run_releaser(scenario_path, repo_path)
 
     # THEN: Origin has release branch
-    assert_repo_path = origin.clone(["v1"]).working_tree_dir
+    assert_repo_path = origin.worktree("v1")
 
     # THEN: Git graph has expected structure
-    git_graph_result = git_graph(assert_repo_path)
-    assert (
-        git_graph_result == (RESOURCES_DIR / "test_scenario_log_v100.txt").read_text()
+    git_graph_file = git_graph(assert_repo_path, scenario_path / "graph_v100.txt")
+    assert filecmp.cmp(
+        git_graph_file, RESOURCES_DIR / "test_scenario_log_v100.txt", shallow=False
     )
 
     # THEN: Committed file exists in release branch
-    committed_file = pathlib.Path(assert_repo_path) / "README.md"
+    committed_file = assert_repo_path / "README.md"
     assert committed_file.exists()
-    assert committed_file.read_text() == "breaking change"
+    assert committed_file.read_bytes() == b"breaking change"
 
     # THEN: Changelog exists and has expected content
-    actual_changelog = pathlib.Path(assert_repo_path) / "CHANGELOG.md"
+    actual_changelog = assert_repo_path / "CHANGELOG.md"
     expected_changelog = test_release_v011[1].add("commit_sha_3", str(commit))
     assert actual_changelog.read_text() == expected_changelog.render(
         "changelog_v100.md.j2"
     )
 
     # THEN: Github output exists and has expected content
-    github_output_content = parse_github_output(tmp_path / "github_output.txt")
+    github_output_content = parse_github_output(scenario_path / "github_output.txt")
     assert github_output_content.get("ready") == "true"
     assert github_output_content.get("tag") == "v1.0.0"
     assert github_output_content.get("changelog", "").endswith(".md")